@@ -954,7 +954,7 @@ def fancy_pca(img: np.ndarray, alpha: float = 0.1) -> np.ndarray:
         msg = "Image must be RGB image in uint8 format."
         raise TypeError(msg)
 
-    orig_img = img.astype(float).copy()
+    orig_img = img.astype(float)
 
     img = img / 255.0  # rescale to 0 to 1 range
 
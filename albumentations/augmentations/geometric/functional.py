@@ -26,7 +26,9 @@ __all__ = [
     "pad",
     "pad_with_params",
     "bbox_rot90",
+    "bboxes_rot90",
     "keypoint_rot90",
+    "keypoints_rot90",
     "rotate",
     "bbox_rotate",
     "keypoint_rotate",
@@ -57,6 +59,10 @@ __all__ = [
     "bbox_hflip",
     "bbox_transpose",
     "bbox_vflip",
+    "bboxes_flip",
+    "bboxes_hflip",
+    "bboxes_transpose",
+    "bboxes_vflip",
     "hflip",
     "hflip_cv2",
     "transpose",
@@ -64,6 +70,10 @@ __all__ = [
     "keypoint_hflip",
     "keypoint_transpose",
     "keypoint_vflip",
+    "keypoints_flip",
+    "keypoints_hflip",
+    "keypoints_transpose",
+    "keypoints_vflip",
     "normalize_bbox",
     "denormalize_bbox",
     "vflip",
@@ -104,6 +114,33 @@ def bbox_rot90(bbox: BoxInternalType, factor: int, rows: int, cols: int) -> BoxI
     return bbox
 
 
+def bboxes_rot90(bboxes: np.ndarray, factor: int, rows: int, cols: int, **params: Any) -> np.ndarray:
+    """Rotates an array of bounding boxes by 90 degrees CCW (see np.rot90)
+
+    Args:
+        bboxes: An array of bounding boxes with shape `(N, 4)` in format `(x_min, y_min, x_max, y_max)`.
+        factor: Number of CCW rotations. Must be in set {0, 1, 2, 3} See np.rot90.
+        rows: Image rows.
+        cols: Image cols.
+        **params: Additional parameters.
+
+    Returns:
+        An array of rotated bounding boxes with shape `(N, 4)`.
+
+    """
+    if factor not in {0, 1, 2, 3}:
+        msg = "Parameter n must be in set {0, 1, 2, 3}"
+        raise ValueError(msg)
+    x_min, y_min, x_max, y_max = bboxes.T
+    if factor == 1:
+        return np.stack([y_min, 1 - x_max, y_max, 1 - x_min], axis=1)
+    if factor == ROT90_180_FACTOR:
+        return np.stack([1 - x_max, 1 - y_max, 1 - x_min, 1 - y_min], axis=1)
+    if factor == ROT90_270_FACTOR:
+        return np.stack([1 - y_max, x_min, 1 - y_min, x_max], axis=1)
+    return bboxes
+
+
 def bbox_d4(bbox: BoxInternalType, group_member: D4Type, rows: int, cols: int) -> BoxInternalType:
     """Applies a `D_4` symmetry group transformation to a bounding box.
 
@@ -186,6 +223,37 @@ def keypoint_rot90(
     return x, y, angle, scale
 
 
+def keypoints_rot90(keypoints: np.ndarray, factor: int, rows: int, cols: int, **params: Any) -> np.ndarray:
+    """Rotate an array of keypoints by 90 degrees counter-clockwise (CCW) a specified number of times.
+
+    Args:
+        keypoints: An array of keypoints with shape `(N, 4)` in format `(x, y, angle, scale)`.
+        factor: The number of 90 degree CCW rotations to apply. Must be in the range [0, 3].
+        rows: The height of the image the keypoints belong to.
+        cols: The width of the image the keypoints belong to.
+        **params: Additional parameters.
+
+    Returns:
+        An array of rotated keypoints with shape `(N, 4)`.
+
+    Raises:
+        ValueError: If the factor is not in the set {0, 1, 2, 3}.
+
+    """
+    if factor not in {0, 1, 2, 3}:
+        raise ValueError("Parameter factor must be in set {0, 1, 2, 3}")
+
+    x, y, angle, scale = keypoints.T
+    if factor == 1:
+        x, y, angle = y, (cols - 1) - x, angle - math.pi / 2
+    elif factor == ROT90_180_FACTOR:
+        x, y, angle = (cols - 1) - x, (rows - 1) - y, angle - math.pi
+    elif factor == ROT90_270_FACTOR:
+        x, y, angle = (rows - 1) - y, x, angle + math.pi / 2
+
+    return np.stack([x, y, np.mod(angle, 2 * np.pi), scale], axis=1)
+
+
 def keypoint_d4(
     keypoint: KeypointInternalType,
     group_member: D4Type,
@@ -1167,6 +1235,167 @@ def keypoint_transpose(keypoint: KeypointInternalType, rows: int, cols: int) ->
     return new_x, new_y, angle, scale
 
 
+def bboxes_vflip(bboxes: np.ndarray, rows: int, cols: int) -> np.ndarray:
+    """Flip an array of bounding boxes vertically around the x-axis.
+
+    Args:
+        bboxes: An array of bounding boxes with shape `(N, 4)` in format `(x_min, y_min, x_max, y_max)`.
+        rows: Image rows.
+        cols: Image cols.
+
+    Returns:
+        An array of flipped bounding boxes with shape `(N, 4)`.
+
+    """
+    flipped = bboxes.astype(float)
+    # only the y columns change
+    np.subtract(1, bboxes[:, 3], out=flipped[:, 1])
+    np.subtract(1, bboxes[:, 1], out=flipped[:, 3])
+    return flipped
+
+
+def bboxes_hflip(bboxes: np.ndarray, rows: int, cols: int) -> np.ndarray:
+    """Flip an array of bounding boxes horizontally around the y-axis.
+
+    Args:
+        bboxes: An array of bounding boxes with shape `(N, 4)` in format `(x_min, y_min, x_max, y_max)`.
+        rows: Image rows.
+        cols: Image cols.
+
+    Returns:
+        An array of flipped bounding boxes with shape `(N, 4)`.
+
+    """
+    flipped = bboxes.astype(float)
+    # only the x columns change
+    np.subtract(1, bboxes[:, 2], out=flipped[:, 0])
+    np.subtract(1, bboxes[:, 0], out=flipped[:, 2])
+    return flipped
+
+
+def bboxes_flip(bboxes: np.ndarray, d: int, rows: int, cols: int) -> np.ndarray:
+    """Flip an array of bounding boxes either vertically, horizontally or both depending on the value of `d`.
+
+    Args:
+        bboxes: An array of bounding boxes with shape `(N, 4)` in format `(x_min, y_min, x_max, y_max)`.
+        d: dimension. 0 for vertical flip, 1 for horizontal, -1 for transpose
+        rows: Image rows.
+        cols: Image cols.
+
+    Returns:
+        An array of flipped bounding boxes with shape `(N, 4)`.
+
+    Raises:
+        ValueError: if value of `d` is not -1, 0 or 1.
+
+    """
+    if d == 0:
+        return bboxes_vflip(bboxes, rows, cols)
+    if d == 1:
+        return bboxes_hflip(bboxes, rows, cols)
+    if d == -1:
+        return bboxes_vflip(bboxes_hflip(bboxes, rows, cols), rows, cols)
+    raise ValueError(f"Invalid d value {d}. Valid values are -1, 0 and 1")
+
+
+def bboxes_transpose(bboxes: np.ndarray, rows: int, cols: int) -> np.ndarray:
+    """Transpose an array of bounding boxes along the main diagonal.
+
+    Args:
+        bboxes: An array of bounding boxes with shape `(N, 4)` in format `(x_min, y_min, x_max, y_max)`.
+        rows: Image rows.
+        cols: Image cols.
+
+    Returns:
+        An array of transposed bounding boxes with shape `(N, 4)`.
+
+    """
+    return bboxes[:, [1, 0, 3, 2]]
+
+
+def keypoints_vflip(keypoints: np.ndarray, rows: int, cols: int) -> np.ndarray:
+    """Flip an array of keypoints vertically around the x-axis.
+
+    Args:
+        keypoints: An array of keypoints with shape `(N, 4)` in format `(x, y, angle, scale)`.
+        rows: Image height.
+        cols: Image width.
+
+    Returns:
+        An array of flipped keypoints with shape `(N, 4)`.
+
+    """
+    flipped = keypoints.astype(float)
+    # x and scale are unchanged
+    np.subtract(rows - 1, keypoints[:, 1], out=flipped[:, 1])
+    np.mod(-keypoints[:, 2], 2 * np.pi, out=flipped[:, 2])
+    return flipped
+
+
+def keypoints_hflip(keypoints: np.ndarray, rows: int, cols: int) -> np.ndarray:
+    """Flip an array of keypoints horizontally around the y-axis.
+
+    Args:
+        keypoints: An array of keypoints with shape `(N, 4)` in format `(x, y, angle, scale)`.
+        rows: Image height.
+        cols: Image width.
+
+    Returns:
+        An array of flipped keypoints with shape `(N, 4)`.
+
+    """
+    flipped = keypoints.astype(float)
+    # y and scale are unchanged
+    np.subtract(cols - 1, keypoints[:, 0], out=flipped[:, 0])
+    np.mod(math.pi - keypoints[:, 2], 2 * np.pi, out=flipped[:, 2])
+    return flipped
+
+
+def keypoints_flip(keypoints: np.ndarray, d: int, rows: int, cols: int) -> np.ndarray:
+    """Flip an array of keypoints either vertically, horizontally or both depending on the value of `d`.
+
+    Args:
+        keypoints: An array of keypoints with shape `(N, 4)` in format `(x, y, angle, scale)`.
+        d: Number of flip. Must be -1, 0 or 1:
+            * 0 - vertical flip,
+            * 1 - horizontal flip,
+            * -1 - vertical and horizontal flip.
+        rows: Image height.
+        cols: Image width.
+
+    Returns:
+        An array of flipped keypoints with shape `(N, 4)`.
+
+    Raises:
+        ValueError: if value of `d` is not -1, 0 or 1.
+
+    """
+    if d == 0:
+        return keypoints_vflip(keypoints, rows, cols)
+    if d == 1:
+        return keypoints_hflip(keypoints, rows, cols)
+    if d == -1:
+        return keypoints_vflip(keypoints_hflip(keypoints, rows, cols), rows, cols)
+    raise ValueError(f"Invalid d value {d}. Valid values are -1, 0 and 1")
+
+
+def keypoints_transpose(keypoints: np.ndarray, rows: int, cols: int) -> np.ndarray:
+    """Transpose an array of keypoints along the main diagonal.
+
+    Args:
+        keypoints: An array of keypoints with shape `(N, 4)` in format `(x, y, angle, scale)`.
+        rows: Total number of rows (height) in the image.
+        cols: Total number of columns (width) in the image.
+
+    Returns:
+        An array of transposed keypoints with shape `(N, 4)`.
+
+    """
+    x, y, angle, scale = keypoints.T
+    angle = np.where(angle <= np.pi, np.pi / 2 - angle, 3 * np.pi / 2 - angle)
+    return np.stack([y, x, np.mod(angle, 2 * np.pi), scale], axis=1)
+
+
 @preserve_channel_dim
 def pad(
     img: np.ndarray,
@@ -1301,8 +1530,8 @@ def grid_distortion(
         prev = cur
 
     map_x, map_y = np.meshgrid(xx, yy)
-    map_x = map_x.astype(np.float32)
-    map_y = map_y.astype(np.float32)
+    map_x = map_x.astype(np.float32, copy=False)
+    map_y = map_y.astype(np.float32, copy=False)
 
     remap_fn = maybe_process_in_chunks(
         cv2.remap,
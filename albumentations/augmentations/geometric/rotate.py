@@ -59,6 +59,12 @@ class RandomRotate90(DualTransform):
     def apply_to_keypoint(self, keypoint: KeypointInternalType, factor: int, **params: Any) -> BoxInternalType:
         return fgeometric.keypoint_rot90(keypoint, factor, **params)
 
+    def apply_to_bboxes_batch(self, bboxes: np.ndarray, factor: int, **params: Any) -> np.ndarray:
+        return fgeometric.bboxes_rot90(bboxes, factor, **params)
+
+    def apply_to_keypoints_batch(self, keypoints: np.ndarray, factor: int, **params: Any) -> np.ndarray:
+        return fgeometric.keypoints_rot90(keypoints, factor, **params)
+
     def get_transform_init_args_names(self) -> Tuple[()]:
         return ()
 
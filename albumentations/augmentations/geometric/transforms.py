@@ -1518,6 +1518,12 @@ class VerticalFlip(DualTransform):
     def apply_to_keypoint(self, keypoint: KeypointInternalType, **params: Any) -> KeypointInternalType:
         return fgeometric.keypoint_vflip(keypoint, **params)
 
+    def apply_to_bboxes_batch(self, bboxes: np.ndarray, **params: Any) -> np.ndarray:
+        return fgeometric.bboxes_vflip(bboxes, **params)
+
+    def apply_to_keypoints_batch(self, keypoints: np.ndarray, **params: Any) -> np.ndarray:
+        return fgeometric.keypoints_vflip(keypoints, **params)
+
     def get_transform_init_args_names(self) -> Tuple[()]:
         return ()
 
@@ -1552,6 +1558,12 @@ class HorizontalFlip(DualTransform):
     def apply_to_keypoint(self, keypoint: KeypointInternalType, **params: Any) -> KeypointInternalType:
         return fgeometric.keypoint_hflip(keypoint, **params)
 
+    def apply_to_bboxes_batch(self, bboxes: np.ndarray, **params: Any) -> np.ndarray:
+        return fgeometric.bboxes_hflip(bboxes, **params)
+
+    def apply_to_keypoints_batch(self, keypoints: np.ndarray, **params: Any) -> np.ndarray:
+        return fgeometric.keypoints_hflip(keypoints, **params)
+
     def get_transform_init_args_names(self) -> Tuple[()]:
         return ()
 
@@ -1590,6 +1602,12 @@ class Flip(DualTransform):
     def apply_to_keypoint(self, keypoint: KeypointInternalType, **params: Any) -> KeypointInternalType:
         return fgeometric.keypoint_flip(keypoint, **params)
 
+    def apply_to_bboxes_batch(self, bboxes: np.ndarray, **params: Any) -> np.ndarray:
+        return fgeometric.bboxes_flip(bboxes, **params)
+
+    def apply_to_keypoints_batch(self, keypoints: np.ndarray, **params: Any) -> np.ndarray:
+        return fgeometric.keypoints_flip(keypoints, **params)
+
     def get_transform_init_args_names(self) -> Tuple[()]:
         return ()
 
@@ -1619,6 +1637,12 @@ class Transpose(DualTransform):
     def apply_to_keypoint(self, keypoint: KeypointInternalType, **params: Any) -> KeypointInternalType:
         return fgeometric.keypoint_transpose(keypoint, **params)
 
+    def apply_to_bboxes_batch(self, bboxes: np.ndarray, **params: Any) -> np.ndarray:
+        return fgeometric.bboxes_transpose(bboxes, **params)
+
+    def apply_to_keypoints_batch(self, keypoints: np.ndarray, **params: Any) -> np.ndarray:
+        return fgeometric.keypoints_transpose(keypoints, **params)
+
     def get_transform_init_args_names(self) -> Tuple[()]:
         return ()
 
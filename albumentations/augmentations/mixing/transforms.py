@@ -107,6 +107,8 @@ class MixUp(ReferenceBasedTransform):
     """
 
     _targets = (Targets.IMAGE, Targets.MASK, Targets.GLOBAL_LABEL)
+    # `mix_data` is the user's reference item as returned by `read_fn`, it is saved for replay with `deepcopy`
+    _params_need_deepcopy = True
 
     class InitSchema(BaseTransformInitSchema):
         reference_data: Optional[Union[Generator[Any, None, None], Sequence[Any]]] = None
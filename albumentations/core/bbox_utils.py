@@ -2,6 +2,7 @@ from typing import Any, Dict, List, Optional, Sequence, Tuple, cast
 
 import numpy as np
 
+from . import utils
 from .types import BoxInternalType, BoxType
 from .utils import DataProcessor, Params
 
@@ -57,6 +58,10 @@ class BboxParams(Params):
         clip (bool): If True, bounding boxes will be clipped to the image borders before applying any transform.
             Default: False.
 
+    Note:
+        Bounding boxes are checked for validity on every call. Set the environment variable
+        `ALBUMENTATIONS_VALIDATE=0` (or `false`) to skip these checks for data that is known to be valid.
+
     """
 
     def __init__(
@@ -135,20 +140,34 @@ class BboxProcessor(DataProcessor):
         )
 
     def check(self, data: Sequence[BoxType], rows: int, cols: int) -> None:
-        check_bboxes(data)
+        if utils.VALIDATE_DATA:
+            check_bboxes(data)
 
     def convert_from_albumentations(self, data: Sequence[BoxType], rows: int, cols: int) -> List[BoxType]:
-        return convert_bboxes_from_albumentations(data, self.params.format, rows, cols, check_validity=True)
+        return convert_bboxes_from_albumentations(
+            data,
+            self.params.format,
+            rows,
+            cols,
+            check_validity=utils.VALIDATE_DATA,
+        )
 
     def convert_to_albumentations(self, data: Sequence[BoxType], rows: int, cols: int) -> List[BoxType]:
         if self.params.clip:
             data = convert_bboxes_to_albumentations(data, self.params.format, rows, cols, check_validity=False)
             data = filter_bboxes(data, rows, cols, min_area=0, min_visibility=0, min_width=0, min_height=0)
-            for bbox in data:
-                check_bbox(bbox)
+            if utils.VALIDATE_DATA:
+                for bbox in data:
+                    check_bbox(bbox)
             return data
 
-        return convert_bboxes_to_albumentations(data, self.params.format, rows, cols, check_validity=True)
+        return convert_bboxes_to_albumentations(
+            data,
+            self.params.format,
+            rows,
+            cols,
+            check_validity=utils.VALIDATE_DATA,
+        )
 
 
 def normalize_bbox(bbox: BoxType, rows: int, cols: int) -> BoxType:
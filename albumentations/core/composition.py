@@ -1,7 +1,7 @@
 import random
 import warnings
 from collections import OrderedDict, defaultdict
-from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Union, cast
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Sequence, Set, Tuple, Union, cast
 
 import cv2
 import numpy as np
@@ -18,7 +18,7 @@ from .serialization import (
     instantiate_nonserializable,
 )
 from .transforms_interface import BasicTransform
-from .utils import format_args, get_shape
+from .utils import DataProcessor, format_args, get_shape
 
 __all__ = [
     "BaseCompose",
@@ -184,6 +184,9 @@ class Compose(BaseCompose, HubMixin):
 
     """
 
+    # data names, including additional targets, filtered by each of `_check_each_transform` processors
+    _check_each_transform_fields: Optional[Tuple[Tuple[DataProcessor, FrozenSet[str]], ...]] = None
+
     def __init__(
         self,
         transforms: TransformsSeqType,
@@ -250,6 +253,10 @@ class Compose(BaseCompose, HubMixin):
     def disable_check_args_private(self) -> None:
         self.is_check_args = False
 
+    def add_targets(self, additional_targets: Optional[Dict[str, str]]) -> None:
+        super().add_targets(additional_targets)
+        self._check_each_transform_fields = None
+
     def __call__(self, *args: Any, force_apply: bool = False, **data: Any) -> Dict[str, Any]:
         if args:
             msg = "You have to pass data to augmentations as named arguments, for example: aug(image=image)"
@@ -309,11 +316,20 @@ class Compose(BaseCompose, HubMixin):
     def _check_data_post_transform(self, data: Any) -> Dict[str, Any]:
         rows, cols = get_shape(data["image"])
 
-        for p in self._check_each_transform:
-            for data_name in data:
-                if data_name in p.data_fields or (
-                    data_name in self._additional_targets and self._additional_targets[data_name] in p.data_fields
-                ):
+        if self._check_each_transform_fields is None:
+            self._check_each_transform_fields = tuple(
+                (
+                    p,
+                    frozenset(p.data_fields).union(
+                        k for k, v in self._additional_targets.items() if v in p.data_fields
+                    ),
+                )
+                for p in self._check_each_transform
+            )
+
+        for p, data_names in self._check_each_transform_fields:
+            for data_name in data_names:
+                if data_name in data:
                     data[data_name] = p.filter(data[data_name], rows, cols)
         return data
 
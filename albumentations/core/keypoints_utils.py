@@ -1,6 +1,7 @@
 import math
 from typing import Any, Dict, List, Optional, Sequence
 
+from . import utils
 from .types import KeypointType
 from .utils import DataProcessor, Params
 
@@ -42,6 +43,10 @@ class KeypointParams(Params):
         check_each_transform (bool): if `True`, then keypoints will be checked after each dual transform.
             Default: `True`
 
+    Note:
+        Keypoints are checked for validity on every call. Set the environment variable
+        `ALBUMENTATIONS_VALIDATE=0` (or `false`) to skip these checks for data that is known to be valid.
+
     """
 
     def __init__(
@@ -109,7 +114,8 @@ class KeypointsProcessor(DataProcessor):
         return filter_keypoints(data, rows, cols, remove_invisible=self.params.remove_invisible)
 
     def check(self, data: Sequence[KeypointType], rows: int, cols: int) -> None:
-        check_keypoints(data, rows, cols)
+        if utils.VALIDATE_DATA:
+            check_keypoints(data, rows, cols)
 
     def convert_from_albumentations(self, data: Sequence[KeypointType], rows: int, cols: int) -> List[KeypointType]:
         params = self.params
@@ -1,5 +1,6 @@
-import random
 from copy import deepcopy
+from itertools import chain
+from random import random as _rand
 from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple, Union, cast
 from warnings import warn
 
@@ -12,6 +13,7 @@ from albumentations.core.validation import ValidatedTransformMeta
 
 from .serialization import Serializable, SerializableMeta, get_shortest_class_fullname
 from .types import (
+    MIN_BATCH_SIZE,
     BoxInternalType,
     BoxType,
     ColorType,
@@ -43,6 +45,27 @@ class CombinedMeta(SerializableMeta, ValidatedTransformMeta):
     pass
 
 
+def _fast_clone_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy params for replay. Arrays are copied, other values are shared: they are expected to be immutable.
+
+    Transforms whose params contain mutable containers set `_params_need_deepcopy` instead.
+    """
+    return {k: v.copy() if isinstance(v, np.ndarray) else v for k, v in params.items()}
+
+
+def _coordinates_to_array(items: Sequence[Sequence[Any]]) -> Optional[np.ndarray]:
+    """Collect the first four values of bboxes or keypoints into an `(N, 4)` float array.
+
+    Returns None if any of these values is an integer: the per-item methods keep integer coordinates as integers.
+    """
+    coordinates = [item[:4] for item in items]
+    if any(
+        issubclass(value_type, (int, np.integer)) for value_type in set(map(type, chain.from_iterable(coordinates)))
+    ):
+        return None
+    return np.array(coordinates, dtype=float)
+
+
 class BasicTransform(Serializable, metaclass=CombinedMeta):
     _targets: Union[Tuple[Targets, ...], Targets]  # targets that this transform can work on
     _available_keys: Set[str]  # targets that this transform, as string, lower-cased
@@ -50,6 +73,10 @@ class BasicTransform(Serializable, metaclass=CombinedMeta):
         str,
         Callable[..., Any],
     ]  # mapping for targets (plus additional targets) and methods for which they depend
+    _dispatch_cache: Dict[
+        Tuple[str, ...],
+        Tuple[Tuple[str, Optional[Callable[..., Any]]], ...],
+    ]  # resolved (key, target function) pairs for each sequence of input keys seen by `apply_with_params`
     call_backup = None
     interpolation: int
     fill_value: ColorType
@@ -59,6 +86,10 @@ class BasicTransform(Serializable, metaclass=CombinedMeta):
     save_key = "replay"
     replay_mode = False
     applied_in_replay = False
+    # set to True in subclasses whose params contain mutable containers that must be saved with `deepcopy`
+    _params_need_deepcopy = False
+    # names of `interpolation`, `fill_value`, `mask_fill_value` set on the instance, resolved in `update_params`
+    _extra_param_names: Optional[Tuple[str, ...]] = None
 
     class InitSchema(BaseTransformInitSchema):
         pass
@@ -84,6 +115,7 @@ class BasicTransform(Serializable, metaclass=CombinedMeta):
         # replay mode params
         self.params: Dict[Any, Any] = {}
         self._key2func = {}
+        self._dispatch_cache = {}
         self._set_keys()
 
     def __call__(self, *args: Any, force_apply: bool = False, **kwargs: Any) -> Any:
@@ -96,19 +128,23 @@ class BasicTransform(Serializable, metaclass=CombinedMeta):
 
             return kwargs
 
-        if force_apply or (random.random() < self.p):
+        if force_apply or (_rand() < self.p):
             params = self.get_params()
 
-            if self.targets_as_params:
-                if not all(key in kwargs for key in self.targets_as_params):
-                    msg = f"{self.__class__.__name__} requires {self.targets_as_params}"
+            # `targets_as_params` is a property that may build a new list on each access
+            target_keys = self.targets_as_params
+            if target_keys:
+                if not all(key in kwargs for key in target_keys):
+                    msg = f"{self.__class__.__name__} requires {target_keys}"
                     raise ValueError(msg)
 
-                targets_as_params = {k: kwargs[k] for k in self.targets_as_params}
+                targets_as_params = {k: kwargs[k] for k in target_keys}
                 params_dependent_on_targets = self.get_params_dependent_on_targets(targets_as_params)
                 params.update(params_dependent_on_targets)
             if self.deterministic:
-                kwargs[self.save_key][id(self)] = deepcopy(params)
+                kwargs[self.save_key][id(self)] = (
+                    deepcopy(params) if self._params_need_deepcopy else _fast_clone_params(params)
+                )
             return self.apply_with_params(params, **kwargs)
 
         return kwargs
@@ -116,15 +152,25 @@ class BasicTransform(Serializable, metaclass=CombinedMeta):
     def apply_with_params(self, params: Dict[str, Any], *args: Any, **kwargs: Any) -> Dict[str, Any]:
         """Apply transforms with parameters."""
         params = self.update_params(params, **kwargs)
+        keys = tuple(kwargs)
+        dispatch = self._dispatch_cache.get(keys)
+        if dispatch is None:
+            dispatch = self._compile_dispatch(keys)
         res = {}
-        for key, arg in kwargs.items():
-            if key in self._key2func and arg is not None:
-                target_function = self._key2func[key]
+        for key, target_function in dispatch:
+            arg = kwargs[key]
+            if target_function is not None and arg is not None:
                 res[key] = target_function(arg, **params)
             else:
                 res[key] = arg
         return res
 
+    def _compile_dispatch(self, keys: Tuple[str, ...]) -> Tuple[Tuple[str, Optional[Callable[..., Any]]], ...]:
+        """Resolve target functions for the given input keys once and cache them for the next calls."""
+        dispatch = tuple((key, self._key2func.get(key)) for key in keys)
+        self._dispatch_cache[keys] = dispatch
+        return dispatch
+
     def set_deterministic(self, flag: bool, save_key: str = "replay") -> "BasicTransform":
         """Set transform to be deterministic."""
         if save_key == "params":
@@ -171,8 +217,11 @@ class BasicTransform(Serializable, metaclass=CombinedMeta):
                 target.value.lower()
                 for target in (self._targets if isinstance(self._targets, tuple) else [self._targets])
             }
-        self._available_keys.update(self.targets.keys())
-        self._key2func = {key: self.targets[key] for key in self._available_keys if key in self.targets}
+        # `targets` builds a new dict of bound methods on each access, so resolve it once
+        targets = self.targets
+        self._available_keys.update(targets.keys())
+        self._key2func = {key: targets[key] for key in self._available_keys if key in targets}
+        self._dispatch_cache = {}
 
     @property
     def available_keys(self) -> Set[str]:
@@ -181,13 +230,16 @@ class BasicTransform(Serializable, metaclass=CombinedMeta):
 
     def update_params(self, params: Dict[str, Any], **kwargs: Any) -> Dict[str, Any]:
         """Update parameters with transform specific params"""
-        if hasattr(self, "interpolation"):
-            params["interpolation"] = self.interpolation
-        if hasattr(self, "fill_value"):
-            params["fill_value"] = self.fill_value
-        if hasattr(self, "mask_fill_value"):
-            params["mask_fill_value"] = self.mask_fill_value
-        params.update({"cols": kwargs["image"].shape[1], "rows": kwargs["image"].shape[0]})
+        if self._extra_param_names is None:
+            # subclasses set these attributes after `BasicTransform.__init__`, so probe them on the first call only
+            self._extra_param_names = tuple(
+                name for name in ("interpolation", "fill_value", "mask_fill_value") if hasattr(self, name)
+            )
+        for name in self._extra_param_names:
+            params[name] = getattr(self, name)
+        shape = kwargs["image"].shape
+        params["cols"] = shape[1]
+        params["rows"] = shape[0]
         return params
 
     def add_targets(self, additional_targets: Dict[str, str]) -> None:
@@ -200,6 +252,7 @@ class BasicTransform(Serializable, metaclass=CombinedMeta):
             additional_targets (dict): keys - new target name, values - old target name. ex: {'image2': 'image'}
 
         """
+        targets = self.targets
         for k, v in additional_targets.items():
             if k in self._additional_targets and v != self._additional_targets[k]:
                 raise ValueError(
@@ -208,8 +261,9 @@ class BasicTransform(Serializable, metaclass=CombinedMeta):
                 )
             if v in self._available_keys:
                 self._additional_targets[k] = v
-                self._key2func[k] = self.targets[v]
+                self._key2func[k] = targets[v]
                 self._available_keys.add(k)
+        self._dispatch_cache.clear()
 
     @property
     def targets_as_params(self) -> List[str]:
@@ -275,10 +329,22 @@ class DualTransform(BasicTransform):
             Applies the transform to a single keypoint. Should be implemented in the subclass.
 
         apply_to_bboxes(bboxes: Sequence[BoxType], *args: Any, **params: Any) -> Sequence[BoxType]:
-            Applies the transform to a list of bounding boxes. Delegates to `apply_to_bbox` for each bounding box.
+            Applies the transform to a list of bounding boxes. Delegates to `apply_to_bboxes_batch` if it is
+            overridden along with `apply_to_bbox`, there are at least `MIN_BATCH_SIZE` bounding boxes and none of
+            their coordinates is an integer, otherwise to `apply_to_bbox` for each bounding box.
+
+        apply_to_bboxes_batch(bboxes: np.ndarray, *args: Any, **params: Any) -> np.ndarray:
+            Applies the transform to an `(N, 4)` array of bounding boxes. Can be overridden in the subclass
+            with a vectorized implementation.
 
         apply_to_keypoints(keypoints: Sequence[KeypointType], *args: Any, **params: Any) -> Sequence[KeypointType]:
-            Applies the transform to a list of keypoints. Delegates to `apply_to_keypoint` for each keypoint.
+            Applies the transform to a list of keypoints. Delegates to `apply_to_keypoints_batch` if it is
+            overridden along with `apply_to_keypoint`, there are at least `MIN_BATCH_SIZE` keypoints and none of
+            their coordinates is an integer, otherwise to `apply_to_keypoint` for each keypoint.
+
+        apply_to_keypoints_batch(keypoints: np.ndarray, *args: Any, **params: Any) -> np.ndarray:
+            Applies the transform to an `(N, 4)` array of keypoints. Can be overridden in the subclass
+            with a vectorized implementation.
 
         apply_to_mask(mask: np.ndarray, *args: Any, **params: Any) -> np.ndarray:
             Applies the transform specifically to a single mask.
@@ -315,26 +381,86 @@ class DualTransform(BasicTransform):
         msg = f"Method apply_to_global_label is not implemented in class {self.__class__.__name__}"
         raise NotImplementedError(msg)
 
+    def _has_batch_override(self, batch_name: str, single_name: str) -> bool:
+        """Check whether the vectorized method `batch_name` is overridden for the per-item method `single_name`.
+
+        The override is used only if it is defined in the class that defines `single_name` or in its subclass,
+        so a subclass that overrides just the per-item method is never bypassed.
+        """
+        mro = type(self).__mro__
+        batch_cls = next(cls for cls in mro if batch_name in vars(cls))
+        single_cls = next(cls for cls in mro if single_name in vars(cls))
+        return batch_cls is not DualTransform and issubclass(batch_cls, single_cls)
+
     def apply_to_bboxes(self, bboxes: Sequence[BoxType], *args: Any, **params: Any) -> Sequence[BoxType]:
+        bboxes_array = (
+            _coordinates_to_array(bboxes)
+            if len(bboxes) >= MIN_BATCH_SIZE and self._has_batch_override("apply_to_bboxes_batch", "apply_to_bbox")
+            else None
+        )
+        if bboxes_array is None:
+            return [
+                self.apply_to_bbox(cast(BoxInternalType, tuple(cast(BoxInternalType, bbox[:4]))), **params)
+                + tuple(bbox[4:])
+                for bbox in bboxes
+            ]
+
+        transformed = self.apply_to_bboxes_batch(bboxes_array, **params)
         return [
-            self.apply_to_bbox(cast(BoxInternalType, tuple(cast(BoxInternalType, bbox[:4]))), **params)
-            + tuple(bbox[4:])
-            for bbox in bboxes
+            cast(BoxType, tuple(bbox_array) + tuple(bbox[4:])) for bbox_array, bbox in zip(transformed.tolist(), bboxes)
         ]
 
+    def apply_to_bboxes_batch(self, bboxes: np.ndarray, *args: Any, **params: Any) -> np.ndarray:
+        """Apply the transform to an array of bounding boxes with shape `(N, 4)`.
+
+        Subclasses may override this method with vectorized array math; the default implementation
+        delegates to `apply_to_bbox` for each row.
+        """
+        transformed = np.empty(bboxes.shape, dtype=float)
+        for i, bbox in enumerate(bboxes.tolist()):
+            transformed[i] = self.apply_to_bbox(cast(BoxInternalType, tuple(bbox)), **params)[:4]
+        return transformed
+
     def apply_to_keypoints(
         self,
         keypoints: Sequence[KeypointType],
         *args: Any,
         **params: Any,
     ) -> Sequence[KeypointType]:
+        keypoints_array = (
+            _coordinates_to_array(keypoints)
+            if len(keypoints) >= MIN_BATCH_SIZE
+            and self._has_batch_override("apply_to_keypoints_batch", "apply_to_keypoint")
+            else None
+        )
+        if keypoints_array is None:
+            return [
+                self.apply_to_keypoint(cast(KeypointInternalType, tuple(keypoint[:4])), **params) + tuple(keypoint[4:])
+                for keypoint in keypoints
+            ]
+
+        transformed = self.apply_to_keypoints_batch(keypoints_array, **params)
         return [
-            self.apply_to_keypoint(cast(KeypointInternalType, tuple(keypoint[:4])), **params) + tuple(keypoint[4:])
-            for keypoint in keypoints
+            cast(KeypointType, tuple(keypoint_array) + tuple(keypoint[4:]))
+            for keypoint_array, keypoint in zip(transformed.tolist(), keypoints)
         ]
 
+    def apply_to_keypoints_batch(self, keypoints: np.ndarray, *args: Any, **params: Any) -> np.ndarray:
+        """Apply the transform to an array of keypoints with shape `(N, 4)`.
+
+        Subclasses may override this method with vectorized array math; the default implementation
+        delegates to `apply_to_keypoint` for each row.
+        """
+        transformed = np.empty(keypoints.shape, dtype=float)
+        for i, keypoint in enumerate(keypoints.tolist()):
+            transformed[i] = self.apply_to_keypoint(cast(KeypointInternalType, tuple(keypoint)), **params)[:4]
+        return transformed
+
     def apply_to_mask(self, mask: np.ndarray, *args: Any, **params: Any) -> np.ndarray:
-        return self.apply(mask, **{k: cv2.INTER_NEAREST if k == "interpolation" else v for k, v in params.items()})
+        # `params` is this call's own kwargs dict, so it can be modified without copying
+        if "interpolation" in params:
+            params["interpolation"] = cv2.INTER_NEAREST
+        return self.apply(mask, **params)
 
     def apply_to_masks(self, masks: Sequence[np.ndarray], **params: Any) -> List[np.ndarray]:
         return [self.apply_to_mask(mask, **params) for mask in masks]
@@ -83,6 +83,7 @@ THREE_SIXTY = 360
 
 BIG_INTEGER = MAX_VALUES_BY_DTYPE[np.uint32]
 MAX_RAIN_ANGLE = 45  # Maximum angle for rain augmentation in degrees
+MIN_BATCH_SIZE = 32  # Fewer bboxes or keypoints are faster to transform one by one than as an array
 
 
 PercentType = Union[
@@ -1,3 +1,4 @@
+import os
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple, Union
 
@@ -11,6 +12,17 @@ if TYPE_CHECKING:
     import torch
 
 
+def _validate_data_from_env() -> bool:
+    # only an explicit opt-out disables the checks
+    return os.getenv("ALBUMENTATIONS_VALIDATE", "1").lower() not in {"0", "false"}
+
+
+# Validity checks of bounding boxes and keypoints done by the processors on every call.
+# Set the environment variable ALBUMENTATIONS_VALIDATE=0 (or false) to skip them once the input data is known to be
+# valid.
+VALIDATE_DATA = _validate_data_from_env()
+
+
 def get_shape(img: Union["np.ndarray", "torch.Tensor"]) -> SizeType:
     if isinstance(img, np.ndarray):
         return img.shape[:2]
@@ -179,17 +191,18 @@ def to_tuple(
         msg = "Arguments 'low' and 'bias' cannot be used together."
         raise ValueError(msg)
 
-    if isinstance(param, Sequence) and len(param) == PAIR:
-        min_val, max_val = min(param), max(param)
-
     # Handle scalar input
-    elif isinstance(param, (int, float)):
+    if isinstance(param, (int, float)):
         if isinstance(low, (int, float)):
             # Use low and param to create a tuple
             min_val, max_val = (low, param) if low < param else (param, low)
         else:
             # Create a symmetric tuple around 0
             min_val, max_val = -param, param
+
+    # tuple and list go first: they match without the slower `Sequence` ABC check
+    elif isinstance(param, (tuple, list, Sequence)) and len(param) == PAIR:
+        min_val, max_val = min(param), max(param)
     else:
         msg = "Argument 'param' must be either a scalar or a sequence of 2 elements."
         raise ValueError(msg)
@@ -612,3 +612,16 @@ def test_bbox_clipping_perspective() -> None:
     bboxes = np.array([[0, 0, 100, 100, 1]])
     res = transform(image=image, bboxes=bboxes)["bboxes"]
     assert len(res) == 0
+
+
+@pytest.mark.parametrize("bbox_format", ["albumentations", "pascal_voc"])
+def test_bbox_validity_check_can_be_disabled(monkeypatch, bbox_format):
+    image = np.zeros((100, 100, 3), dtype=np.uint8)
+    bboxes = [(0.6, 0.2, 0.4, 0.5, 1)] if bbox_format == "albumentations" else [(60, 20, 40, 50, 1)]
+    aug = Compose([NoOp()], bbox_params=BboxParams(format=bbox_format))
+
+    with pytest.raises(ValueError):
+        aug(image=image, bboxes=bboxes)
+
+    monkeypatch.setattr("albumentations.core.utils.VALIDATE_DATA", False)
+    aug(image=image, bboxes=bboxes)
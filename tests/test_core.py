@@ -39,7 +39,7 @@ from albumentations.core.transforms_interface import (
     ImageOnlyTransform,
     NoOp
 )
-from albumentations.core.utils import to_tuple
+from albumentations.core.utils import _validate_data_from_env, to_tuple
 from tests.conftest import IMAGES
 
 from .utils import get_filtered_transforms
@@ -113,6 +113,27 @@ def test_to_tuple(input, kwargs, expected):
     assert to_tuple(input, **kwargs) == expected
 
 
+@pytest.mark.parametrize(
+    ["value", "expected"],
+    [
+        (None, True),
+        ("1", True),
+        ("true", True),
+        ("True", True),
+        ("yes", True),
+        ("0", False),
+        ("false", False),
+        ("FALSE", False),
+    ],
+)
+def test_validate_data_from_env(monkeypatch, value, expected):
+    if value is None:
+        monkeypatch.delenv("ALBUMENTATIONS_VALIDATE", raising=False)
+    else:
+        monkeypatch.setenv("ALBUMENTATIONS_VALIDATE", value)
+    assert _validate_data_from_env() is expected
+
+
 @pytest.mark.parametrize("image", IMAGES)
 def test_image_only_transform(image):
     mask = image.copy()
@@ -406,6 +427,22 @@ def test_check_each_transform(targets, bbox_params, keypoint_params, expected):
     for key, item in expected.items():
         assert np.all(np.array(item) == np.array(res[key]))
 
+
+def test_check_each_transform_additional_targets_added_after_call():
+    image = np.empty([100, 100], dtype=np.uint8)
+    bboxes = [[0, 0, 10, 10, 0], [5, 5, 70, 70, 0], [60, 60, 70, 70, 0]]
+    expected = [[25, 25, 35, 35, 0], [30, 30, 75, 75, 0]]
+    augs = Compose(
+        [Crop(0, 0, 50, 50), PadIfNeeded(100, 100)], bbox_params=BboxParams("pascal_voc", check_each_transform=True)
+    )
+    augs(image=image, bboxes=bboxes)
+
+    augs.add_targets({"bboxes2": "bboxes"})
+    res = augs(image=image, bboxes=bboxes, bboxes2=bboxes)
+
+    assert np.array_equal(res["bboxes"], expected)
+    assert np.array_equal(res["bboxes2"], expected)
+
 @pytest.mark.parametrize("image", IMAGES)
 def test_bbox_params_is_not_set(image, bboxes):
     t = Compose([A.NoOp(p=1.0)])
@@ -509,7 +546,10 @@ def test_sequential_with_horizontal_flip_prob_1(image):
     transform = Sequential([HorizontalFlip(p=1)], p=1)
     expected_transform = Compose([HorizontalFlip(p=1)])
 
-    with patch('random.random', return_value=0.1):  # Mocking probability less than 1
+    # Mock the probability draws of Sequential and of the transforms below 1
+    with patch('random.random', return_value=0.1), patch(
+        'albumentations.core.transforms_interface._rand', return_value=0.1
+    ):
         result = transform(image=image, mask=mask)
         expected = expected_transform(image=image, mask=mask)
 
@@ -522,13 +562,23 @@ def test_sequential_with_horizontal_flip_prob_0(image):
     mask = image.copy()
     transform = Sequential([HorizontalFlip(p=1)], p=0)
 
-    with patch('random.random', return_value=0.99):  # Mocking probability greater than 0
+    with patch('random.random', return_value=0.99):  # Mocking the Sequential probability draw greater than 0
         result = transform(image=image, mask=mask)
 
     assert np.array_equal(result['image'], image)
     assert np.array_equal(result['mask'], mask)
 
 
+@pytest.mark.parametrize(["draw", "applied"], [(0.1, True), (0.9, False)])
+def test_transform_probability_draw(draw, applied):
+    image = np.arange(12, dtype=np.uint8).reshape(3, 4)
+
+    with patch('albumentations.core.transforms_interface._rand', return_value=draw):
+        result = HorizontalFlip(p=0.5)(image=image)
+
+    assert np.array_equal(result['image'], image[:, ::-1] if applied else image)
+
+
 # Test 3: Multiple flips and Transpose with probability 1
 @pytest.mark.parametrize("image", IMAGES)
 @pytest.mark.parametrize("aug", [A.HorizontalFlip, A.VerticalFlip, A.Transpose])
@@ -540,7 +590,10 @@ def test_sequential_multiple_transformations(image, aug):
         aug(p=1),
     ], p=1)
 
-    with patch('random.random', return_value=0.1):  # Ensuring all transforms are applied
+    # Mock the probability draws of Sequential and of the transforms, ensuring all transforms are applied
+    with patch('random.random', return_value=0.1), patch(
+        'albumentations.core.transforms_interface._rand', return_value=0.1
+    ):
         result = transform(image=image, mask=mask)
 
     # Since HorizontalFlip, VerticalFlip, and Transpose are all applied twice, the image should be the same
@@ -705,3 +758,151 @@ def test_transform_always_apply_warning() -> None:
 
     assert record[0].message.args[0] == warning_expected_2
     assert aug.transforms[0].p == 0.5
+
+
+def test_return_params_copies_array_params() -> None:
+    matrix = np.eye(3)
+
+    class ArrayParamTransform(ImageOnlyTransform):
+        def apply(self, img, matrix, **params):
+            return img
+
+        def get_params(self):
+            return {"matrix": matrix, "scale": 2}
+
+        def get_transform_init_args_names(self):
+            return ()
+
+    aug = Compose([ArrayParamTransform(p=1)], return_params=True)
+    data = aug(image=np.zeros((8, 8), dtype=np.uint8))
+    saved_params = next(iter(data["applied_params"].values()))
+
+    assert saved_params["scale"] == 2
+    assert np.array_equal(saved_params["matrix"], matrix)
+    assert saved_params["matrix"] is not matrix
+
+
+def test_dual_transform_batch_fallback_uses_single_item_methods() -> None:
+    aug = A.Transpose(p=1)
+    bboxes = np.array([[0.1, 0.2, 0.3, 0.4], [0.5, 0.6, 0.7, 0.8]])
+    keypoints = np.array([[10, 20, 0.5, 1], [30, 40, 1.5, 2]])
+
+    expected_bboxes = DualTransform.apply_to_bboxes_batch(aug, bboxes, rows=100, cols=100)
+    expected_keypoints = DualTransform.apply_to_keypoints_batch(aug, keypoints, rows=100, cols=100)
+
+    assert np.allclose(aug.apply_to_bboxes_batch(bboxes, rows=100, cols=100), expected_bboxes)
+    assert np.allclose(aug.apply_to_keypoints_batch(keypoints, rows=100, cols=100), expected_keypoints)
+
+
+def test_mixup_return_params_copies_reference_data() -> None:
+    reference_data = [{"image": np.ones((8, 8, 3), dtype=np.uint8), "global_label": np.array([1, 0])}]
+    aug = Compose([A.MixUp(reference_data=reference_data, read_fn=lambda x: x, p=1)], return_params=True)
+    data = aug(image=np.zeros((8, 8, 3), dtype=np.uint8), global_label=np.array([0, 1]))
+    saved_params = next(iter(data["applied_params"].values()))
+
+    assert saved_params["mix_data"] is not reference_data[0]
+    assert saved_params["mix_data"]["image"] is not reference_data[0]["image"]
+    assert np.array_equal(saved_params["mix_data"]["image"], reference_data[0]["image"])
+
+
+@pytest.mark.parametrize("aug", [A.HorizontalFlip, A.VerticalFlip, A.Transpose, A.RandomRotate90])
+@pytest.mark.parametrize("num_keypoints", [1, 40])
+def test_integer_keypoints_stay_integer(aug, num_keypoints) -> None:
+    image = np.zeros((100, 200, 3), dtype=np.uint8)
+    keypoints = [(10 + i, 20 + i) for i in range(num_keypoints)]
+    transform = Compose([aug(p=1)], keypoint_params=KeypointParams("xy"))
+
+    result = transform(image=image, keypoints=keypoints)["keypoints"]
+
+    assert len(result) == num_keypoints
+    assert all(type(value) is int for keypoint in result for value in keypoint)
+
+
+def test_horizontal_flip_integer_keypoint() -> None:
+    image = np.zeros((100, 200, 3), dtype=np.uint8)
+    transform = Compose([A.HorizontalFlip(p=1)], keypoint_params=KeypointParams("xy"))
+
+    assert transform(image=image, keypoints=[(10, 20)])["keypoints"] == [(189, 20)]
+
+
+@pytest.mark.parametrize(
+    ["aug", "aug_params"],
+    [
+        [A.HorizontalFlip, {}],
+        [A.VerticalFlip, {}],
+        [A.Transpose, {}],
+        [A.Flip, {"d": -1}],
+        [A.RandomRotate90, {"factor": 1}],
+    ],
+)
+def test_batch_path_matches_single_item_methods(aug, aug_params) -> None:
+    transform = aug(p=1)
+    params = {"rows": 100, "cols": 200, **aug_params}
+    bboxes = [(0.01 * i, 0.02 * i, 0.5 + 0.01 * i, 0.6 + 0.005 * i, "label") for i in range(40)]
+    keypoints = [(1.5 * i, 2.0 * i, 0.1 * i, 1.0, "label") for i in range(40)]
+
+    expected_bboxes = [transform.apply_to_bbox(bbox[:4], **params) + bbox[4:] for bbox in bboxes]
+    expected_keypoints = [transform.apply_to_keypoint(keypoint[:4], **params) + keypoint[4:] for keypoint in keypoints]
+
+    for bbox, expected_bbox in zip(transform.apply_to_bboxes(bboxes, **params), expected_bboxes):
+        assert bbox[-1] == expected_bbox[-1]
+        assert np.allclose(bbox[:4], expected_bbox[:4])
+    for keypoint, expected_keypoint in zip(transform.apply_to_keypoints(keypoints, **params), expected_keypoints):
+        assert keypoint[-1] == expected_keypoint[-1]
+        assert np.allclose(keypoint[:4], expected_keypoint[:4])
+
+
+def test_dual_transform_batch_fallback_keeps_float_results_for_integer_arrays() -> None:
+    aug = A.HorizontalFlip(p=1)
+    keypoints = np.array([[10, 20, 0, 1]])
+
+    result = DualTransform.apply_to_keypoints_batch(aug, keypoints, rows=100, cols=200)
+
+    assert result.dtype == np.float64
+    assert np.allclose(result, [aug.apply_to_keypoint((10, 20, 0, 1), rows=100, cols=200)])
+
+
+@pytest.mark.parametrize("num_items", [3, 40])
+def test_subclass_per_item_override_is_used_for_any_number_of_items(num_items) -> None:
+    class CustomFlip(A.HorizontalFlip):
+        def apply_to_bbox(self, bbox, **params):
+            return (0.0, 0.0, 0.5, 0.5)
+
+        def apply_to_keypoint(self, keypoint, **params):
+            return (1.0, 2.0, 0.0, 1.0)
+
+    transform = CustomFlip(p=1)
+    bboxes = [(0.1, 0.1, 0.2, 0.2, "label")] * num_items
+    keypoints = [(10.0, 20.0, 0.0, 1.0, "label")] * num_items
+
+    assert transform.apply_to_bboxes(bboxes, rows=100, cols=100) == [(0.0, 0.0, 0.5, 0.5, "label")] * num_items
+    assert transform.apply_to_keypoints(keypoints, rows=100, cols=100) == [(1.0, 2.0, 0.0, 1.0, "label")] * num_items
+
+
+def test_add_targets_after_call_updates_dispatch() -> None:
+    image = np.arange(16, dtype=np.uint8).reshape(4, 4)
+    aug = HorizontalFlip(p=1)
+
+    result = aug(image=image, image2=image)
+    assert np.array_equal(result["image2"], image)
+
+    aug.add_targets({"image2": "image"})
+    result = aug(image=image, image2=image)
+    assert np.array_equal(result["image2"], image[:, ::-1])
+
+
+def test_image_only_transform_passes_other_targets_through() -> None:
+    image = np.full((8, 8, 3), 100, dtype=np.uint8)
+    mask = np.ones((8, 8), dtype=np.uint8)
+    bboxes = [(0.1, 0.2, 0.3, 0.4, 1)]
+    aug = A.InvertImg(p=1)
+    aug.add_targets({"image2": "image"})
+
+    result = aug(image=image, mask=mask, bboxes=bboxes, image2=image, labels=None)
+
+    assert list(result) == ["image", "mask", "bboxes", "image2", "labels"]
+    assert np.array_equal(result["image"], 255 - image)
+    assert np.array_equal(result["image2"], 255 - image)
+    assert result["mask"] is mask
+    assert result["bboxes"] is bboxes
+    assert result["labels"] is None
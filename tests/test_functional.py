@@ -1,4 +1,5 @@
 import hashlib
+from functools import partial
 import cv2
 import numpy as np
 import pytest
@@ -518,6 +519,91 @@ def test_bbox_flip(code, func):
     assert FGeometric.bbox_flip(bbox, code, rows, cols) == func(bbox, rows, cols)
 
 
+@pytest.mark.parametrize(
+    ["batch_func", "func"],
+    [
+        [FGeometric.bboxes_vflip, FGeometric.bbox_vflip],
+        [FGeometric.bboxes_hflip, FGeometric.bbox_hflip],
+        [FGeometric.bboxes_transpose, FGeometric.bbox_transpose],
+        *[[partial(FGeometric.bboxes_flip, d=d), partial(FGeometric.bbox_flip, d=d)] for d in (-1, 0, 1)],
+        *[[partial(FGeometric.bboxes_rot90, factor=f), partial(FGeometric.bbox_rot90, factor=f)] for f in range(4)],
+    ],
+)
+def test_bboxes_batch_matches_single(batch_func, func):
+    rows, cols = 100, 200
+    bboxes = np.array([[0.1, 0.2, 0.6, 0.5], [0.0, 0.0, 1.0, 1.0], [0.25, 0.3, 0.4, 0.9]])
+    expected = np.array([func(tuple(bbox), rows=rows, cols=cols) for bbox in bboxes])
+    assert np.allclose(batch_func(bboxes, rows=rows, cols=cols), expected)
+
+
+@pytest.mark.parametrize(
+    ["batch_func", "func"],
+    [
+        [FGeometric.keypoints_vflip, FGeometric.keypoint_vflip],
+        [FGeometric.keypoints_hflip, FGeometric.keypoint_hflip],
+        [FGeometric.keypoints_transpose, FGeometric.keypoint_transpose],
+        *[[partial(FGeometric.keypoints_flip, d=d), partial(FGeometric.keypoint_flip, d=d)] for d in (-1, 0, 1)],
+        *[
+            [partial(FGeometric.keypoints_rot90, factor=f), partial(FGeometric.keypoint_rot90, factor=f)]
+            for f in range(4)
+        ],
+    ],
+)
+def test_keypoints_batch_matches_single(batch_func, func):
+    rows, cols = 100, 200
+    keypoints = np.array([[20, 30, 0.5, 1], [0, 99, np.pi, 2], [150, 10, 1.5 * np.pi, 0.5], [199, 0, 0, 1]])
+    expected = np.array([func(tuple(keypoint), rows=rows, cols=cols) for keypoint in keypoints])
+    assert np.allclose(batch_func(keypoints, rows=rows, cols=cols), expected)
+
+
+@pytest.mark.parametrize(
+    "batch_func",
+    [
+        FGeometric.keypoints_vflip,
+        FGeometric.keypoints_hflip,
+        FGeometric.keypoints_transpose,
+        *[partial(FGeometric.keypoints_flip, d=d) for d in (-1, 0, 1)],
+        *[partial(FGeometric.keypoints_rot90, factor=f) for f in range(4)],
+    ],
+)
+def test_keypoints_batch_accepts_integer_array(batch_func):
+    rows, cols = 100, 200
+    keypoints = np.array([[10, 20, 0, 1], [150, 99, 3, 2]])
+    assert np.allclose(
+        batch_func(keypoints, rows=rows, cols=cols),
+        batch_func(keypoints.astype(float), rows=rows, cols=cols),
+    )
+
+
+@pytest.mark.parametrize(
+    "batch_func",
+    [
+        FGeometric.bboxes_vflip,
+        FGeometric.bboxes_hflip,
+        FGeometric.bboxes_transpose,
+        *[partial(FGeometric.bboxes_flip, d=d) for d in (-1, 0, 1)],
+        *[partial(FGeometric.bboxes_rot90, factor=f) for f in range(4)],
+    ],
+)
+def test_bboxes_batch_accepts_integer_array(batch_func):
+    bboxes = np.array([[0, 0, 1, 1]])
+    assert np.allclose(batch_func(bboxes, rows=100, cols=200), batch_func(bboxes.astype(float), rows=100, cols=200))
+
+@pytest.mark.parametrize("factor", range(4))
+def test_rot90_batch_accepts_additional_params(factor):
+    bboxes = np.array([[0.1, 0.2, 0.6, 0.5]])
+    keypoints = np.array([[20, 30, 0.5, 1]])
+
+    assert np.allclose(
+        FGeometric.bboxes_rot90(bboxes, factor, rows=100, cols=200, shape=(100, 200)),
+        FGeometric.bboxes_rot90(bboxes, factor, rows=100, cols=200),
+    )
+    assert np.allclose(
+        FGeometric.keypoints_rot90(keypoints, factor, rows=100, cols=200, shape=(100, 200)),
+        FGeometric.keypoint_rot90(tuple(keypoints[0]), factor, rows=100, cols=200, shape=(100, 200)),
+    )
+
+
 def test_crop_bbox_by_coords():
     cropped_bbox = A.crop_bbox_by_coords((0.5, 0.2, 0.9, 0.7), (18, 18, 82, 82), 64, 64, 100, 100)
     assert cropped_bbox == (0.5, 0.03125, 1.125, 0.8125)
@@ -390,3 +390,15 @@ def test_coarse_dropout_remove_keypoints(
     result_keypoints = t.apply_to_keypoints(keypoints, holes)
 
     assert set(result_keypoints) == set(expected_keypoints)
+
+
+def test_keypoint_validity_check_can_be_disabled(monkeypatch):
+    image = np.zeros((100, 100, 3), dtype=np.uint8)
+    aug = A.Compose([A.NoOp()], keypoint_params=A.KeypointParams(format="albumentations"))
+    keypoints = [(150, 20, 0, 0)]
+
+    with pytest.raises(ValueError):
+        aug(image=image, keypoints=keypoints)
+
+    monkeypatch.setattr("albumentations.core.utils.VALIDATE_DATA", False)
+    aug(image=image, keypoints=keypoints)